@@ -29,6 +29,4 @@ __all__ = (
 )
 
 # Update pdoc at all levels.
-__pdoc__ = {}
-for doc in [doc1, doc2]:
-    __pdoc__.update(doc)
+__pdoc__ = {**doc1, **doc2}
@@ -3,15 +3,19 @@
 # native
 from __future__ import annotations
 from typing import Any
+from typing import cast
 from typing import Dict
 from typing import Mapping
 from typing import Optional
 from typing import TypeVar
 
 # pkg
+from .fn import _as_path
 from .fn import AnyIndex
 from .fn import dict_merge
 from .fn import get_path
+from .fn import is_real_attr
+from .fn import NOT_FOUND
 from .fn import set_path
 
 __all__ = ["AttrDict"]
@@ -20,9 +24,6 @@ __all__ = ["AttrDict"]
 Self = TypeVar("Self", bound="AttrDict")
 """`AttrDict` instance."""
 
-NOT_FOUND = object()
-"""Sentinel for a missing object."""
-
 
 class AttrDict(Dict[str, Any]):
     """Like a `dict`, but with attribute syntax.
@@ -48,8 +49,13 @@ class AttrDict(Dict[str, Any]):
             >>> clone.a = 5
             >>> items != clone
             True
+            >>> type(clone) is AttrDict
+            True
         """
-        return self.__class__(super().copy())
+        # NOTE: Skip `__init__` and bulk-copy the underlying `dict`.
+        clone = dict.__new__(self.__class__)
+        dict.update(clone, self)
+        return clone
 
     def __contains__(self, key: Any) -> bool:
         """Return `True` if `key` is a key.
@@ -76,8 +82,12 @@ class AttrDict(Dict[str, Any]):
             True
             >>> ['a', 1, 'x'] in items
             False
+            >>> ['x'] in items
+            False
         """
-        return self.get(key, NOT_FOUND) is not NOT_FOUND
+        if type(key) is str:
+            return dict.__contains__(self, key)
+        return get_path(self, key, NOT_FOUND) is not NOT_FOUND
 
     def __getattr__(self, name: str) -> Optional[Any]:
         """Return the value of the attribute or `None`.
@@ -110,7 +120,7 @@ class AttrDict(Dict[str, Any]):
             True
         """
         # NOTE: This method is only called when the attribute cannot be found.
-        return self[name]
+        return dict.get(self, name)
 
     def __setattr__(self, name: str, value: Any) -> None:
         """Set the value of an attribute.
@@ -138,12 +148,19 @@ class AttrDict(Dict[str, Any]):
             3
             >>> item['b'] is None
             True
+
+            Class attributes count too, even if added after the class is created:
+            >>> class Sub(AttrDict): pass
+            >>> Sub.extra = 1
+            >>> item = Sub()
+            >>> item.extra = 2  # instance attribute
+            >>> item.extra, item['extra']
+            (2, None)
         """
-        try:
-            super().__getattribute__(name)  # is real?
-            super().__setattr__(name, value)
-        except AttributeError:  # use key/value
-            self[name] = value
+        if is_real_attr(self, name):  # is real?
+            object.__setattr__(self, name, value)
+        else:  # use key/value
+            dict.__setitem__(self, name, value)
 
     def __delattr__(self, name: str) -> None:
         """Delete an attribute.
@@ -171,11 +188,13 @@ class AttrDict(Dict[str, Any]):
             >>> item
             {'b': 1}
         """
-        try:
-            super().__getattribute__(name)  # is real?
-            super().__delattr__(name)
-        except AttributeError:  # use key/value
-            del self[name]
+        if is_real_attr(self, name):  # is real?
+            try:
+                object.__delattr__(self, name)
+                return
+            except AttributeError:  # class attribute; can't delete it here
+                pass
+        del self[name]  # use key/value
 
     def __getitem__(self, key: AnyIndex) -> Optional[Any]:
         """Return the value of the key.
@@ -193,7 +212,9 @@ class AttrDict(Dict[str, Any]):
             >>> item['b'] is None
             True
         """
-        return self.get(key)
+        if type(key) is str:
+            return dict.get(self, key)
+        return get_path(self, key)
 
     def __setitem__(self, key: AnyIndex, value: Any) -> None:
         """Set the value of a key.
@@ -211,8 +232,16 @@ class AttrDict(Dict[str, Any]):
             >>> item[['a', 'b']] = 10
             >>> item.a.b
             10
+
+            Non-`str` keys that aren't a path are set directly:
+            >>> item[0] = 20
+            >>> item[0]
+            20
         """
-        self.set(key, value)
+        if type(key) is str:
+            dict.__setitem__(self, key, value)
+        else:
+            self.set(key, value)
 
     def __delitem__(self, key: str) -> None:
         """Delete a key.
@@ -233,7 +262,7 @@ class AttrDict(Dict[str, Any]):
             {'a': 1}
         """
         try:
-            super().__delitem__(key)
+            dict.__delitem__(self, key)
         except KeyError:
             pass
 
@@ -269,9 +298,43 @@ class AttrDict(Dict[str, Any]):
             True
             >>> items.get(['d', 'e']) is None # int is not indexable
             True
+            >>> items.get(['e'], 5) # missing keys use the default
+            5
+        """
+        if type(path) is str:
+            return dict.get(self, path, default)
+        return get_path(self, path, default)
+
+    def get_path(
+        self, path: AnyIndex, default: Optional[Any] = None, /
+    ) -> Optional[Any]:
+        """Return the value at a nested `path` or `default` if it cannot be found.
+
+        NOTE: Unlike `.get()`, this does not check for a `str` key first,
+        so it is slightly faster for callers that always pass a path.
+        Like other methods, it takes precedence over a `"get_path"` key for
+        attribute access; use `item["get_path"]` to read such a key.
+
+        Args:
+            path (AnyIndex): path to the value
+            default (Any, optional): value to return if `path` is not found.
+                Defaults to `None`.
+
+        Returns:
+            Optional[Any]: value at `path` or `default` if it is not found
+
+        Examples:
+            >>> items = AttrDict(a=dict(b=[{"c": 3}, {"c": -10}]))
+            >>> items.get_path(('a', 'b', 1, 'c'))
+            -10
+            >>> items.get_path(('a', 'x'), 5)
+            5
+
+            A key with the same name is only available by index:
+            >>> items = AttrDict(get_path=1)
+            >>> callable(items.get_path), items["get_path"]
+            (True, 1)
         """
-        if isinstance(path, str):
-            return super().get(path, default)
         return get_path(self, path, default)
 
     def set(self: Self, path: AnyIndex, value: Optional[Any] = None, /) -> Self:
@@ -301,8 +364,9 @@ class AttrDict(Dict[str, Any]):
             >>> items.set((), 20)
             {'a': 1, 'b': {'c': {'d': 10}}}
         """
-        if isinstance(path, str):
-            super().__setitem__(path, value)
+        if _as_path(path) is None:
+            # NOTE: Not a path, so `set_path` would only call us again.
+            dict.__setitem__(self, cast(str, path), value)
             return self
 
         set_path(self, path, value, self.__class__)
@@ -333,6 +397,34 @@ class AttrDict(Dict[str, Any]):
         dict_merge(self, other, cls_dict=self.__class__)
         return self
 
+    def merge_all(self: Self, *others: Mapping[str, Any]) -> Self:
+        """Merge all of `others` into `self` in a single pass.
+
+        NOTE: This is equivalent to (but faster than) `self << a << b << c`.
+        Like other methods, it takes precedence over a `"merge_all"` key for
+        attribute access; use `item["merge_all"]` to read such a key.
+
+        Args:
+            *others (Mapping[str, Any]): other dictionaries to merge in order
+
+        Returns:
+            AttrDict: merged dictionary
+
+        Examples:
+            >>> item = AttrDict(a=1, b=2)
+            >>> item.merge_all({"b": 3}, {"c": {"d": 4}}, {"c": {"e": 5}})
+            {'a': 1, 'b': 3, 'c': {'d': 4, 'e': 5}}
+            >>> item.c.e
+            5
+
+            A key with the same name is only available by index:
+            >>> item = AttrDict(merge_all=1)
+            >>> callable(item.merge_all), item["merge_all"]
+            (True, 1)
+        """
+        dict_merge(self, *others, cls_dict=self.__class__)
+        return self
+
 
 __pdoc__ = {
     "AttrDict.__contains__": True,
@@ -2,12 +2,16 @@
 
 # native
 from __future__ import annotations
+from functools import lru_cache
 from typing import Any
 from typing import List
 from typing import SupportsIndex
 from typing import TypeVar
 from typing import Union
 
+# pkg
+from .fn import is_real_attr
+
 Self = TypeVar("Self", bound="AttrList")
 """`AttrList` instance."""
 
@@ -15,6 +19,7 @@ AttrListKey = Union[SupportsIndex, slice, str]
 """`AttrList` key type."""
 
 
+@lru_cache(maxsize=256)
 def str2index(index: str) -> AttrListKey:
     """Return a slice or numeric index.
 
@@ -69,6 +74,24 @@ class AttrList(List[Any]):
     ['apple', 'bat', 'cat']
     """
 
+    def copy(self: Self) -> Self:
+        """Return a shallow copy.
+
+        Examples:
+            >>> items = AttrList([1, 2, 3])
+            >>> clone = items.copy()
+            >>> items == clone # same contents
+            True
+            >>> items is not clone # different pointers
+            True
+            >>> type(clone) is AttrList
+            True
+        """
+        # NOTE: Skip `__init__` and bulk-copy the underlying `list`.
+        clone = list.__new__(self.__class__)
+        list.__init__(clone, self)
+        return clone
+
     def __getattr__(self, name: str) -> AttrList:
         """Return an attribute from all members.
 
@@ -93,12 +116,9 @@ class AttrList(List[Any]):
         """
         # NOTE: This method is only called when the attribute cannot be found.
         # We delegate this call to every member.
-        result = self.__class__()
-        for member in self:
-            # if isinstance(member, AttrDict):  # check if name is defined
-            #     result.append(member[name] if name in member else None)
-            # else:
-            result.append(getattr(member, name, None))
+        # NOTE: Fill the result directly, skipping any subclass `__init__`.
+        result = list.__new__(self.__class__)
+        list.__init__(result, [getattr(member, name, None) for member in self])
         return result
 
     def __setattr__(self, name: str, value: Any) -> None:
@@ -120,11 +140,18 @@ class AttrList(List[Any]):
             >>> items.b = 7
             >>> items.b
             7
+
+            So do class attributes, even if added after the class is created:
+            >>> class Sub(AttrList): pass
+            >>> Sub.extra = 1
+            >>> items = Sub([AttrDict(a=1)])
+            >>> items.extra = 2  # instance attribute
+            >>> items.extra, items
+            (2, [{'a': 1}])
         """
-        try:
-            super().__getattribute__(name)  # is real?
-            super().__setattr__(name, value)
-        except AttributeError:  # use members
+        if is_real_attr(self, name):  # is real?
+            object.__setattr__(self, name, value)
+        else:  # use members
             for member in self:
                 setattr(member, name, value)
 
@@ -150,15 +177,19 @@ class AttrList(List[Any]):
             >>> items
             [{'b': 2}, {'c': 3}, {'d': 4}]
         """
-        try:
-            super().__getattribute__(name)  # is real?
-            super().__delattr__(name)
-        except AttributeError:  # use members
-            for member in self:
-                try:
-                    delattr(member, name)
-                except AttributeError:
-                    pass
+        if is_real_attr(self, name):  # is real?
+            try:
+                object.__delattr__(self, name)
+                return
+            except AttributeError:  # class attribute; can't delete it here
+                pass
+
+        # use members
+        for member in self:
+            try:
+                delattr(member, name)
+            except AttributeError:
+                pass
 
     def __getitem__(self: Self, index: AttrListKey) -> Union[Self, Any]:
         """Return an item from all members (or the list itself).
@@ -195,9 +226,9 @@ class AttrList(List[Any]):
             index = str2index(index)
             result = self.__class__(item[index] for item in self)
         elif isinstance(index, slice):
-            result = self.__class__(super().__getitem__(index))
+            result = self.__class__(list.__getitem__(self, index))
         else:
-            result = super().__getitem__(index)
+            result = list.__getitem__(self, index)
         return result
 
     def __setitem__(self, index: AttrListKey, value: Any) -> None:
@@ -235,11 +266,17 @@ class AttrList(List[Any]):
         """
         if isinstance(index, str):
             index = str2index(index)
+            # NOTE: Members are usually the same type, so we only check
+            # for support when the type changes.
+            last_kind, settable = None, False
             for member in self:
-                if hasattr(member, "__setitem__"):
-                    member.__setitem__(index, value)
+                kind = type(member)
+                if kind is not last_kind:
+                    last_kind, settable = kind, hasattr(kind, "__setitem__")
+                if settable:
+                    member[index] = value
         else:
-            super().__setitem__(index, value)
+            list.__setitem__(self, index, value)
 
     def __delitem__(self, index: AttrListKey) -> None:
         """Delete an item from all members (or the list itself).
@@ -275,11 +312,15 @@ class AttrList(List[Any]):
         """
         if isinstance(index, str):
             index = str2index(index)
+            last_kind, deletable = None, False
             for member in self:
-                if hasattr(member, "__delitem__"):
-                    member.__delitem__(index)
+                kind = type(member)
+                if kind is not last_kind:
+                    last_kind, deletable = kind, hasattr(kind, "__delitem__")
+                if deletable:
+                    del member[index]
         else:
-            super().__delitem__(index)
+            list.__delitem__(self, index)
 
     def __call__(self: Self, *args: Any, **kwargs: Any) -> Self:
         """Return a new list with the result of calling all callables in the list.
@@ -300,9 +341,13 @@ class AttrList(List[Any]):
             >>> items(1)
             [3, 6, 'Z']
         """
-        return self.__class__(
-            item(*args, **kwargs) if callable(item) else item for item in self
+        # NOTE: A list comprehension is faster than feeding a generator to
+        # the constructor; we fill the result directly like `__getattr__`.
+        result = list.__new__(self.__class__)
+        list.__init__(
+            result, [item(*args, **kwargs) if callable(item) else item for item in self]
         )
+        return result
 
 
 __pdoc__ = {
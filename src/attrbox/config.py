@@ -1,17 +1,22 @@
 """Configuration loading and parsing."""
 
 # std
+from __future__ import annotations
 import sys
+from functools import lru_cache
 from inspect import cleandoc
+from keyword import kwlist
 from pathlib import Path
 from typing import Any
 from typing import Callable
 from typing import Dict
-from typing import List
+from typing import FrozenSet
+from typing import Iterable
 from typing import Mapping
 from typing import Optional
 from typing import Sequence
-from typing import Union
+from typing import Set
+import builtins
 import json
 
 # lib
@@ -23,23 +28,21 @@ from . import env
 
 # TODO 2026-10-31 @ py3.10 EOL: remove conditional
 if sys.version_info >= (3, 11):  # pragma: no cover
-    from typing import LiteralString
     import tomllib as toml
 else:  # pragma: no cover
     import tomli as toml
 
-    LiteralString = str
+PYTHON_KEYWORDS: FrozenSet[str] = frozenset(name.lower() for name in kwlist)
+"""Lowercase [Python keywords](https://docs.python.org/3/reference/lexical_analysis.html#keywords)."""
 
-PYTHON_KEYWORDS: List[LiteralString] = """
-    False      await      else       import     pass
-    None       break      except     in         raise
-    True       class      finally    is         return
-    and        continue   for        lambda     try
-    as         def        from       nonlocal   while
-    assert     del        global     not        with
-    async      elif       if         or         yield
-""".lower().split()
-"""[All Python keywords](https://docs.python.org/3/reference/lexical_analysis.html#keywords)."""
+_BUILTINS: FrozenSet[str] = frozenset(name.lower() for name in dir(builtins))
+"""Lowercase names of all python `builtins`."""
+
+_OPTVAR_SPECIAL: Dict[str, str] = {"-": "stdin", "--": "__"}
+"""Special docopt names with fixed variable names."""
+
+_OPTVAR_TRANS: Dict[int, Any] = str.maketrans({"-": "_", "<": "", ">": ""})
+"""Translation table: hyphens become underscores; angle brackets removed."""
 
 LoaderFunc = Callable[[str], Any]
 """Function signature to load configuration from a string."""
@@ -74,10 +77,14 @@ def load_config(
     *,
     load_imports: bool = True,
     loaders: Optional[Mapping[str, LoaderFunc]] = None,
-    done: Optional[List[Path]] = None,
+    done: Optional[Iterable[Path]] = None,
 ) -> Dict[str, Any]:
     """Load a configuration file from `path` using configuration `loaders`.
 
+    NOTE: Each file is loaded at most once, where it is first imported. If
+    `a` imports `[b, c]` and both import `d`, then `d` is loaded under `b`
+    only, so values that `b` overrides in `d` keep `b`'s value.
+
     Args:
         path (Path): file to load.
 
@@ -88,7 +95,7 @@ def load_config(
             to to loader functions. If `None`, uses the global `LOADERS`.
             Defaults to `None`.
 
-        done (List[Path], optional): If provided, a list of paths to ignore when
+        done (Iterable[Path], optional): If provided, paths to ignore when
             doing recursive loading. Defaults to `None`.
 
     Returns:
@@ -101,28 +108,40 @@ def load_config(
         >>> load_config(root / "test/config_1.toml") == expected
         True
     """
+    seen = set(done) if done else set()  # shared across the recursion
+    return _load_config(path.resolve(), load_imports, loaders, seen)
+
+
+def _load_config(
+    path: Path,
+    load_imports: bool,
+    loaders: Optional[Mapping[str, LoaderFunc]],
+    done: Set[Path],
+) -> Dict[str, Any]:
+    """Load a configuration file from an already-resolved `path`.
+
+    NOTE: Imports are resolved once here (so that `done` can spot duplicates)
+    and passed down as is, instead of being resolved again by `load_config`.
+    """
     result = AttrDict()
-    path = path.resolve()
-    done = done or []
+    done.add(path)
 
     loader = (loaders or LOADERS)[path.suffix]
     data = loader(path.read_text())
-    if load_imports and "imports" in data:
-        imports = [(path.parent / p).resolve() for p in data.pop("imports")]
+    imports = data.pop("imports", None) if load_imports else None
+    if imports:
+        parent = path.parent  # already resolved
+        # NOTE: `dict.fromkeys` drops repeats in this list, keeping the first.
+        resolved = dict.fromkeys((parent / p).resolve() for p in imports)
+        imports = [file for file in resolved if file not in done]
+        done.update(imports)  # siblings are loaded here, not by each other
         for file in imports:
-            if file in done:
-                continue
-
-            result <<= load_config(
-                file,
-                load_imports=True,
-                loaders=loaders,
-                done=done + imports,
-            )
+            result <<= _load_config(file, True, loaders, done)
     result <<= data
     return result
 
 
+@lru_cache(maxsize=1024)
 def optvar(
     name: str,
     /,
@@ -181,9 +200,8 @@ def optvar(
         True
     """
     result = name.lower()
-    special = {"-": "stdin", "--": "__"}
-    if result in special:
-        return special[result]
+    if result in _OPTVAR_SPECIAL:
+        return _OPTVAR_SPECIAL[result]
     # special cases handled
 
     result = result.replace("--", "")
@@ -191,23 +209,26 @@ def optvar(
         result = result[1:]
     # leading hyphens removed
 
-    trans: Dict[str, Union[str, int, None]] = {"-": "_", "<": "", ">": ""}
-    result = result.translate(str.maketrans(trans))
+    result = result.translate(_OPTVAR_TRANS)
     # hyphens become underscores; angle brackets removed
 
     if not shadow_keywords and result in PYTHON_KEYWORDS:
         result += "_"
         # don't shadow keywords
 
-    if not shadow_builtins:
-        built_in = [s.lower() for s in globals()["__builtins__"]]
-        if result in built_in:
-            result += "_"
+    if not shadow_builtins and result in _BUILTINS:
+        result += "_"
         # don't shadow builtins
 
     return result
 
 
+@lru_cache(maxsize=32)
+def _cleandoc(doc: str, /) -> str:
+    """Return `inspect.cleandoc(doc)`, cached for repeated parsing of a `doc`."""
+    return cleandoc(doc)
+
+
 def parse_docopt(
     doc: str,
     /,
@@ -256,7 +277,7 @@ def parse_docopt(
     args = {
         optvar(k, shadow_builtins=True): v
         for k, v in docopt(
-            cleandoc(doc),
+            _cleandoc(doc),
             argv=argv,
             help=True,
             version=version,
@@ -267,7 +288,9 @@ def parse_docopt(
     if read_config and "config" in args:
         result <<= load_config(Path(args["config"]))
 
-    for key, val in args.items():
-        key = optvar(key, shadow_builtins=True)
-        result[key.split(".")] = val
+    for key, val in args.items():  # keys already passed through `optvar`
+        if "." in key:
+            result[key.split(".")] = val
+        else:  # no nesting; skip the path walk
+            result[key] = val
     return result
@@ -31,25 +31,39 @@ Examples:
 """
 
 # native
+from __future__ import annotations
 from os import environ as ENV
 from pathlib import Path
+from typing import Any
+from typing import cast
+from typing import ChainMap
 from typing import Dict
 from typing import Optional
 from typing import Mapping
 from typing import Protocol
+from typing import Tuple
 from typing import Union
 from typing import Match
 import re
 
 # pkg
 from .attrdict import AttrDict
+from .fn import get_path
+from .fn import NOT_FOUND
+from .fn import SupportsItem
 
 PathStr = Union[Path, str]
 """Type representing a `Path` or a string to a path."""
 
-_RE_EXPAND = re.compile(r"\$(\w+|\{[^}]*\})", re.ASCII)
+_RE_EXPAND = re.compile(r"\$(?:(\w+)|\{([^}]*)\})", re.ASCII)
 """Regex for finding variable expansions."""
 
+_RE_EOL = re.compile(r"\r\n|\r|\n")
+"""Regex for splitting text into lines on `\\n`, `\\r\\n`, and `\\r` only."""
+
+_RE_LINE = re.compile(r"(?:export\s+)?([^=]*?)\s*=(.*)", re.DOTALL)
+"""Regex for splitting a stripped line into a key and a raw value."""
+
 
 class SupportsRead(Protocol):  # pylint: disable=too-few-public-methods
     """Protocol for a class that implements a `.read()` method."""
@@ -59,6 +73,21 @@ class SupportsRead(Protocol):  # pylint: disable=too-few-public-methods
         return ""  # pragma: no cover
 
 
+class _Lookup(ChainMap[str, Any]):
+    """`ChainMap` that only reads from mappings that contain the key.
+
+    NOTE: `AttrDict` returns `None` for missing keys instead of raising
+    `KeyError`, so a plain `ChainMap` would never reach later mappings.
+    """
+
+    def __getitem__(self, key: str) -> Any:
+        """Return the value of `key` from the first mapping that has it."""
+        for mapping in self.maps:
+            if key in mapping:
+                return mapping[key]
+        return self.__missing__(key)
+
+
 def expand(
     value: str,
     store: Optional[Mapping[str, str]] = None,
@@ -73,7 +102,8 @@ def expand(
         value (str): value to expand
 
         store (Mapping[str, str], optional): valid substitutions.
-            If `None`, `os.environ` is used. Defaults to `None`.
+            If `None`, `os.environ` is used. An empty `store` is used as is
+            (it does not fall back to `os.environ`). Defaults to `None`.
 
         dotted_keys (bool): if `True` allow `${dotted.name}` to map
             to nested values `{"dotted": {"name": "value"}}`.
@@ -93,6 +123,10 @@ def expand(
         >>> expand("no vars", {})
         'no vars'
 
+        An empty `store` means there are no valid substitutions:
+        >>> expand("$HOME", {})
+        '$HOME'
+
         Values are passed to `str`:
         >>> expand("$a", {'a': 5})
         '5'
@@ -104,23 +138,23 @@ def expand(
     if "$" not in value:
         return value
 
-    values = store or ENV
-
-    if dotted_keys and not isinstance(values, AttrDict):
-        values = AttrDict(values)
+    values = ENV if store is None else store
 
     def _repl(match: Match[str]) -> str:
-        value = match.group(0)
-        name = match.group(1)
-        if name.startswith("{") and name.endswith("}"):
-            name = name[1:-1]
+        # NOTE: The regex captures `$var` and `${var}` in separate groups,
+        # so simple names need no further inspection.
+        simple, braced = match.groups()
+        name = braced if simple is None else simple
+        if dotted_keys and simple is None and "." in name:
+            # NOTE: `get_path` walks any `Mapping` (e.g., a `ChainMap`), so
+            # we don't need to copy `values` into an `AttrDict` first.
+            found = get_path(cast(SupportsItem, values), name.split("."), NOT_FOUND)
+        else:
+            found = values.get(name, NOT_FOUND)
 
-        if dotted_keys:
-            name = name.split(".")
-
-        if name in values:
-            value = str(values[name])  # pyright: ignore
-        return value
+        if found is NOT_FOUND:
+            return match.group(0)
+        return str(found)
 
     return _RE_EXPAND.sub(_repl, value)
 
@@ -190,76 +224,138 @@ def loads(
         {'section': {'key': 'value'}}
         >>> loads('section.key=value', update_env=False, dotted_keys=False)
         {'section.key': 'value'}
+
+        Unknown variables are left unchanged:
+        >>> loads('a=${attrbox_missing.name}', update_env=False)
+        {'a': '${attrbox_missing.name}'}
+
+        Only `\\n`, `\\r\\n`, and `\\r` end a line:
+        >>> loads('a=x\\x0cy\\r\\nb=c\\u2028d', update_env=False)
+        {'a': 'x\\x0cy', 'b': 'c\\u2028d'}
+
+        Lines without an `=` are not supported:
+        >>> loads('novalue', update_env=False)
+        Traceback (most recent call last):
+            ...
+        ValueError: Missing '=' in line: novalue
     """
     result = AttrDict()
-    for line in text.replace("\r\n", "\n").split("\n"):
+    lookup = _Lookup(result, ENV)  # values in the file shadow the environment
+    # NOTE: `str.splitlines()` would also split on `\f`, `\u2028`, etc., and
+    # normalizing the endings first would copy the whole text; split once.
+    for line in _RE_EOL.split(text):
+        if not line or line[0] == "#":
+            continue  # skip blank lines and comments without stripping
         line = line.strip()
-        if not line or line.startswith("#"):
-            continue  # skip blank lines and comments
+        if not line or line[0] == "#":
+            continue  # skip indented blank lines and comments
 
-        if line.startswith("export "):
-            line = line[len("export ") :]
+        match = _RE_LINE.match(line)
+        if not match:
+            raise ValueError(f"Missing '=' in line: {line}")
+        key, value = match.groups()
 
-        key, value = line.split("=", 1)
-
-        key = key.strip()
-        if len(key) >= 2 and key.startswith("'") and key.endswith("'"):
+        if len(key) >= 2 and key[0] == "'" and key[-1] == "'":
             key = key[1:-1]  # unquote key
 
-        # We expand the value with the current values which may have
-        # nested structure and then with the environment values (which do not).
-        value = expand(value, result, dotted_keys=dotted_keys)
-        value = expand(value)
+        # We expand the value in a single pass with the current values (which
+        # may have nested structure) and then the environment (which does not).
+        value = expand(value, lookup, dotted_keys=dotted_keys)
 
         value = value.strip()
-        if len(value) >= 2 and (
-            (value.startswith("'") and value.endswith("'"))
-            or (value.startswith('"') and value.endswith('"'))
-        ):
+        if len(value) >= 2 and value[0] in "'\"" and value[-1] == value[0]:
             value = value[1:-1]  # unquote value
 
         if update_env:
             ENV[key] = value
-        if dotted_keys:
+        if dotted_keys and "." in key:
             result[key.split(".")] = value
         else:
             result[key] = value
     return result
 
 
-def find_env(path: Optional[PathStr] = None, name: str = ".env") -> Optional[Path]:
-    """Find the `.env` file in the ancestors of the current path.
-
-    Args:
-        path (PathLike, optional): A starting path to check. If `None`, starts with
-            the current working directory. Defaults to `None`.
-        name (str, optional): file name to search for. Defaults to `".env"`.
-
-    Returns:
-        Optional[Path]: path to environment file or `None` if it is not found.
-
-    Examples:
-        Search from the current working directory:
-        >>> str(find_env())
-        '.../.env'
-
-        Search from a specific directory:
-        >>> str(find_env("."))
-        '.../.env'
-
-        Pass a `Path` object:
-        >>> str(find_env(Path(__file__)))
-        '.../.env'
+class _EnvFinder:
+    """Find `.env` files and cache the ones that are found.
 
-        Point directly to the `.env` file:
-        >>> str(find_env(Path(__file__).parent.parent.parent / ".env"))
-        '.../.env'
+    NOTE: Each step of the search costs a `stat()` call, so found files are
+    cached per (absolute) starting path and `name`. Misses are not cached.
     """
-    if not path:
-        path = Path.cwd()
-    elif isinstance(path, str):
-        path = Path(path).resolve()
 
+    def __init__(self) -> None:
+        self.found: Dict[Tuple[Path, str], Path] = {}
+        """Files found so far, keyed by starting path and name."""
+
+    def __call__(
+        self, path: Optional[PathStr] = None, name: str = ".env"
+    ) -> Optional[Path]:
+        """Find the `.env` file in the ancestors of the current path.
+
+        NOTE: Found files are cached (misses are not) and are not checked
+        again. Call `find_env.cache_clear()` to pick up a nearer file created
+        after a search or to forget a file that was removed.
+
+        Args:
+            path (PathLike, optional): A starting path to check. If `None`,
+                starts with the current working directory. Defaults to `None`.
+            name (str, optional): file name to search for.
+                Defaults to `".env"`.
+
+        Returns:
+            Optional[Path]: path to environment file or `None` if it is not found.
+
+        Examples:
+            Search from the current working directory:
+            >>> str(find_env())
+            '.../.env'
+
+            Search from a specific directory:
+            >>> str(find_env("."))
+            '.../.env'
+
+            Pass a `Path` object:
+            >>> str(find_env(Path(__file__)))
+            '.../.env'
+
+            Point directly to the `.env` file:
+            >>> str(find_env(Path(__file__).parent.parent.parent / ".env"))
+            '.../.env'
+
+            Files created after a miss are found:
+            >>> import tempfile
+            >>> with tempfile.TemporaryDirectory() as tmp:
+            ...     before = find_env(tmp, "attrbox-test.env")
+            ...     _ = (Path(tmp) / "attrbox-test.env").write_text("")
+            ...     after = find_env(tmp, "attrbox-test.env")
+            >>> before is None, after.name
+            (True, 'attrbox-test.env')
+            >>> find_env.cache_clear()
+        """
+        if not path:
+            path = Path.cwd()
+        elif isinstance(path, str):
+            path = Path(path).resolve()
+
+        key = (path, name)
+        found = self.found.get(key)
+        if found is None:
+            found = _find_env(path, name)
+            # NOTE: A relative `path` depends on the working directory.
+            if found is not None and path.is_absolute():
+                self.found[key] = found
+        return found
+
+    def cache_clear(self) -> None:
+        """Forget all the files that were found."""
+        self.found.clear()
+
+
+find_env = _EnvFinder()
+"""Find the `.env` file in the ancestors of a path (see `_EnvFinder.__call__`)."""
+
+
+def _find_env(path: Path, name: str) -> Optional[Path]:
+    """Return the first `name` in `path` or its ancestors."""
     if path.name == name and path.exists():
         return path
 
@@ -1,15 +1,19 @@
 """Generally useful functions."""
 
 # native
+from __future__ import annotations
+from functools import lru_cache
 from typing import Any
+from typing import Callable
 from typing import cast
 from typing import Dict
+from typing import Iterator
 from typing import List
 from typing import Mapping
 from typing import Optional
 from typing import Protocol
-from typing import runtime_checkable
 from typing import Sequence
+from typing import Tuple
 from typing import Type
 from typing import Union
 
@@ -28,8 +32,13 @@ AnyListDict = Union[AnyList, AnyDict]
 AnyIndex = Union[str, int, Sequence[Union[str, int]]]
 """Index into a `list` or `dict`."""
 
+NOT_FOUND = object()
+"""Sentinel for a missing object."""
+
+_SCALAR_TYPES = frozenset({str, int, float, bool, type(None), bytes, list, tuple})
+"""Exact types whose values are never a `Mapping` (skips the ABC check)."""
+
 
-@runtime_checkable
 class SupportsItem(Protocol):  # pragma: no cover
     """Protocol for `k in x`, `x[k]`, and `x[k] = v`."""
 
@@ -44,6 +53,61 @@ class SupportsItem(Protocol):  # pragma: no cover
         """Set `key` to `value`."""
 
 
+def is_real_attr(obj: Any, name: str) -> bool:
+    """Return `True` if `name` is an instance or class attribute of `obj`.
+
+    NOTE: This probes `object.__getattribute__` on every call (nothing is
+    cached), so class attributes that are added or deleted later are seen.
+    Unlike reading `obj.__dict__`, the probe doesn't create an instance
+    dict for objects that don't have one yet.
+
+    Args:
+        obj (Any): object to check
+        name (str): attribute name
+
+    Returns:
+        bool: `True` if `name` is a real attribute, `False` otherwise
+
+    Examples:
+        >>> class Example:
+        ...     x = 1
+        >>> item = Example()
+        >>> is_real_attr(item, "x")
+        True
+        >>> is_real_attr(item, "y")
+        False
+        >>> item.y = 2  # instance attribute
+        >>> is_real_attr(item, "y")
+        True
+        >>> Example.z = 3  # class attribute added later
+        >>> is_real_attr(item, "z")
+        True
+        >>> del Example.z  # ...and removed again
+        >>> is_real_attr(item, "z")
+        False
+    """
+    try:
+        object.__getattribute__(obj, name)  # skips `__getattr__`
+    except AttributeError:
+        return False
+    return True
+
+
+def _as_path(path: AnyIndex) -> Optional[Sequence[Any]]:
+    """Return `path` as a `Sequence` of keys or `None` if it is a single key.
+
+    Examples:
+        >>> _as_path(["a", 0]), _as_path(("a",)), _as_path("a"), _as_path(0)
+        (['a', 0], ('a',), None, None)
+    """
+    # NOTE: `list` and `tuple` paths skip the (slow) `Sequence` ABC check.
+    if isinstance(path, (list, tuple)):
+        return path
+    if isinstance(path, str) or not isinstance(path, Sequence):
+        return None
+    return path
+
+
 def get_path(src: SupportsItem, path: AnyIndex, default: Optional[Any] = None) -> Any:
     """Get the value indicated by `path` or return `default` if it is not found.
 
@@ -61,22 +125,150 @@ def get_path(src: SupportsItem, path: AnyIndex, default: Optional[Any] = None) -
         1
         >>> get_path({'a': [1, {'b': 2}]}, ['a', 1, 'b'])
         2
+
+        A `tuple` of `str` keys through nested `dict` objects is fastest:
+        >>> get_path({'a': {'b': {'c': 3}}}, ('a', 'b', 'c'))
+        3
+        >>> get_path({'a': {'b': {'c': 3}}}, ('a', 'x', 'c'), 5)
+        5
+
+        `dict` subclasses with `__missing__` (e.g., `Counter`) are honored:
+        >>> from collections import Counter
+        >>> get_path({'a': Counter()}, ['a', 'x'])
+        0
+
+        Stepping past a value that isn't indexable returns `default`:
+        >>> get_path({'a': 1, 'b': 2}, ['a', 'b']) is None
+        True
+        >>> get_path({'a': 'hello'}, ['a', 0]) is None # `str` is not a container
+        True
+        >>> get_path({'a': 1}, [], 5)
+        5
     """
-    if isinstance(path, str) or not isinstance(path, Sequence):
-        path = [path]
+    keys = _as_path(path)
+    if keys is None:
+        if type(src) is dict:  # fast path: single key
+            try:
+                return dict.get(src, path, default)
+            except TypeError:  # key is not hashable
+                return default
+        keys = (path,)
+    elif not keys:  # nothing to get
+        return default
+
+    result: Any = src
+    if type(keys) is tuple:  # fast path: str keys through dicts
+        try:
+            for key in keys:
+                if type(key) is not str or not isinstance(result, dict):
+                    break  # use the general walk below
+                if type(result) is dict:
+                    result = dict.get(result, key, NOT_FOUND)
+                    if result is NOT_FOUND:
+                        return default
+                else:  # subclass: honor `__missing__`
+                    result = dict.__getitem__(result, key)
+            else:
+                return result
+        except KeyError:
+            return default
+        result = src
 
-    result: Any = default
     try:
-        for key in path:
-            result = src[key]  # take step
-            if isinstance(result, SupportsItem):
-                src = result  # preserve context
+        # NOTE: Misses in a plain `dict` or a `list` return early instead of
+        # raising. `dict` subclasses are read with `dict.__getitem__`, which
+        # skips their own `__getitem__` but still calls `__missing__` (e.g.,
+        # `defaultdict`, `Counter`). Other containers (anything that supports
+        # item assignment, like the `SupportsItem` protocol) are indexed
+        # directly. Values like `str` and `tuple` are not stepped into.
+        for key in keys:
+            if type(result) is dict:
+                result = dict.get(result, key, NOT_FOUND)
+                if result is NOT_FOUND:
+                    return default  # key doesn't exist
+            elif isinstance(result, dict):
+                result = dict.__getitem__(result, key)
+            elif isinstance(result, list) and isinstance(key, int):
+                if not -len(result) <= key < len(result):
+                    return default  # index is unreachable
+                result = result[key]
+            elif hasattr(type(result), "__setitem__"):
+                result = result[key]  # take step
+            else:  # not a container
+                return default
     except (KeyError, IndexError, TypeError):
         # key doesn't exist, index is unreachable, or item is not indexable
         result = default
     return result
 
 
+GetterFunc = Callable[..., Any]
+"""Function signature of a compiled `get_path` (`getter(src, default=None)`)."""
+
+
+@lru_cache(maxsize=256)
+def compile_path(path: Tuple[Union[str, int], ...]) -> GetterFunc:
+    """Return a reusable getter for a fixed `path`.
+
+    This is useful for hot call sites that repeatedly look up the same
+    nested key. The work that only depends on `path` is done once, here:
+    if every key is a `str`, the getter walks nested plain `dict` objects
+    with `dict.get` and no per-step type checks on the keys; at the first
+    step that isn't a plain `dict` (including subclasses, which may define
+    `__missing__`), it hands the remaining (precomputed) part of the path
+    to `get_path`. Other paths simply use `get_path`.
+
+    Args:
+        path (Tuple[str | int, ...]): path to the value
+
+    Returns:
+        GetterFunc: `getter(src, default=None)` equivalent to
+            `get_path(src, path, default)`
+
+    Examples:
+        >>> getter = compile_path(('a', 'b'))
+        >>> getter({'a': {'b': 1}})
+        1
+        >>> getter({'a': {'c': 1}}, 5)
+        5
+        >>> getter({'a': [1]}, 5) # not a dict; use `get_path`
+        5
+        >>> from collections import defaultdict
+        >>> getter({'a': defaultdict(int)}) # honors `__missing__`
+        0
+        >>> compile_path(('a', 0))({'a': [2, 3]})
+        2
+        >>> compile_path(())({'a': 1}, 5)
+        5
+        >>> compile_path(('a', 'b')) is getter # cached
+        True
+    """
+    if not path:  # nothing to get
+
+        def getter(src: Any, default: Optional[Any] = None) -> Any:
+            return default
+
+    elif all(type(key) is str for key in path):
+        rests = [path[index:] for index in range(len(path))]
+
+        def getter(src: Any, default: Optional[Any] = None) -> Any:
+            result = src
+            for index, key in enumerate(path):
+                if type(result) is not dict:  # continue with general walk
+                    return get_path(result, rests[index], default)
+                result = dict.get(result, key, NOT_FOUND)
+                if result is NOT_FOUND:
+                    return default
+            return result
+
+    else:  # `int` keys need the general walk
+
+        def getter(src: Any, default: Optional[Any] = None) -> Any:
+            return get_path(src, path, default)
+
+    return getter
+
+
 def set_path(
     dest: AnyListDict,
     path: AnyIndex,
@@ -86,6 +278,9 @@ def set_path(
 ) -> AnyListDict:
     """Set a deeply nested value.
 
+    NOTE: `dest` is modified in place (nothing is copied) and returned.
+    If you need the original, pass a `copy.deepcopy` of it instead.
+
     Args:
         dest (Box): a `list` or `dict`
 
@@ -109,24 +304,32 @@ def set_path(
         {'a': [{'b': {'c': 4}}]}
         >>> set_path(item, ['a', 1, 'd'], 5)
         {'a': [{'b': {'c': 4}}, {'d': 5}]}
-    """
-    if isinstance(path, str) or not isinstance(path, Sequence):
-        path = [path]
 
-    last = len(path) - 1
+        An empty path returns `dest` unchanged:
+        >>> set_path(item, [], 6) is item
+        True
+    """
+    keys = _as_path(path)
+    if keys is None:
+        if isinstance(dest, dict):  # fast path: single key
+            dest[path] = value
+            return dest
+        keys = (path,)
+    elif not keys:  # nothing to set
+        return dest
+
+    last = len(keys) - 1
     nested = dest
-    for index, key in enumerate(path):
-        if isinstance(nested, dict) and key not in nested:
-            nested[key] = None
-
-        if isinstance(nested, List):
+    for index, key in enumerate(keys):
+        if isinstance(nested, list):
             if isinstance(key, int):
-                if key >= len(nested):
-                    nested.extend([None] * (key + 1 - len(nested)))
+                missing = key + 1 - len(nested)
+                if missing > 0:  # pad with `None` in one C-level call
+                    nested.extend((None,) * missing)
             else:  # trying to index into a list with a str
                 nested.append(cls_dict([(key, None)]))
                 nested = cast(AnyDict, nested[-1])  # switch to dict context
-        # nested[key] exists for dict[str | int] and list[int | str]
+        # nested[key] is settable for dict[str | int] and list[int | str]
 
         # NOTE: `mypy` can't be sure that we aren't trying to index into
         # a `list` with a `str` down below. But we handled this case, so
@@ -138,17 +341,95 @@ def set_path(
             nested[key] = value
             break  # done
 
-        curr_val = nested[key]
-        next_key = path[index + 1]
-        if isinstance(next_key, (int, slice)) and not isinstance(curr_val, List):
-            nested[key] = cls_list()
-        elif isinstance(next_key, str) and not isinstance(curr_val, Mapping):
-            nested[key] = cls_dict()
+        # NOTE: A single lookup per step; a missing dict key reads as `None`.
+        curr_val: Any
+        if isinstance(nested, dict):
+            curr_val = dict.get(nested, key)
+        else:
+            curr_val = nested[key]
+
+        next_key = keys[index + 1]
+        # NOTE: `dict` comes first in the tuple so plain dicts return before
+        # the (much slower) `Mapping` ABC check runs.
+        if isinstance(next_key, (int, slice)):
+            make: Optional[Type[Any]] = None if isinstance(curr_val, list) else cls_list
+        elif isinstance(next_key, str) and not isinstance(curr_val, (dict, Mapping)):
+            make = cls_dict
+        else:
+            make = None
+
+        if make is None:  # descend into existing value
+            nested = curr_val
+            continue
+
+        # Nothing exists below `key`, so build the rest of the path at once.
+        tail = _make_tail(keys[index + 1 :], value, cls_dict, cls_list)
+        if tail is not NOT_FOUND:
+            nested[key] = tail
+            break  # done
 
-        nested = nested[key]  # move to next step
+        curr_val = make()
+        nested[key] = curr_val
+        nested = curr_val  # move to next step
     return dest
 
 
+def _make_tail(
+    path: Sequence[Any],
+    value: Any,
+    cls_dict: Type[AnyDict],
+    cls_list: Type[AnyList],
+) -> Any:
+    """Return new containers that hold `value` at `path` (built bottom-up).
+
+    Returns `NOT_FOUND` if a key is not a `str` or non-negative `int`;
+    `set_path` then builds those steps one at a time.
+    """
+    result = value
+    for key in reversed(path):
+        kind = type(key)
+        if kind is str:
+            node: Any = cls_dict()
+            node[key] = result
+        elif kind is int and key >= 0:
+            node = cls_list([None] * (key + 1))  # allocate at final size
+            node[key] = result
+        else:
+            return NOT_FOUND
+        result = node
+    return result
+
+
+def _is_flat(src: OnlyReadDict, kind: Type[Any], cls_dict: Type[AnyDict]) -> bool:
+    """Return `True` if `src` can be merged into a `kind` with `.update()`.
+
+    That requires that no value in `src` is a `Mapping` (nothing to descend
+    into) and that `.update()` writes the same items as `node[key] = value`:
+    always for a plain `dict`, but for `cls_dict` (e.g., `AttrDict`, which
+    treats a non-`str` key as a path) only if every key is a `str`.
+
+    Examples:
+        >>> _is_flat({"a": 1, "b": [{"c": 2}]}, dict, dict)
+        True
+        >>> _is_flat({"a": 1, "b": {"c": 2}}, dict, dict)
+        False
+        >>> from . import AttrDict
+        >>> _is_flat({("a", "b"): 1}, AttrDict, AttrDict)
+        False
+    """
+    # NOTE: Exact-type checks are much cheaper than the `Mapping` ABC check,
+    # which only runs for other types (e.g., `dict` subclasses).
+    for value in src.values():
+        value_kind = type(value)
+        if value_kind in _SCALAR_TYPES:
+            continue
+        if value_kind is dict or isinstance(value, Mapping):
+            return False
+    if kind is dict:
+        return True
+    return kind is cls_dict and all(type(key) is str for key in src)
+
+
 def dict_merge(
     dest: AnyDict,
     *sources: OnlyReadDict,
@@ -175,20 +456,56 @@ def dict_merge(
         >>> c = {"d": {"e": 5}}
         >>> dict_merge(a, b, c)
         {'b': {'c': 2, 'e': 3}, 'd': {'e': 5}}
+
+        Nested values replacing a simple value are also converted:
+        >>> from . import AttrDict
+        >>> item = dict_merge({"a": 1}, {"a": {"b": {"c": 2}}}, cls_dict=AttrDict)
+        >>> item["a"].b.c
+        2
     """
     for src in sources:
-        for key, value in src.items():
-            if not isinstance(value, Mapping):
-                # overwrite with simple value
-                dest[key] = value
-                continue
-
-            value = cls_dict(value)
-            prev = dest.get(key, {})
-            if isinstance(prev, dict):  # extendable
-                if not isinstance(prev, cls_dict):
+        if _is_flat(src, type(dest), cls_dict):  # nothing to descend into
+            dest.update(src)
+            continue
+
+        # NOTE: We walk nested dicts with an explicit stack of iterators
+        # (instead of recursing) so that deep configs don't pay for a
+        # Python frame per level. Each source is fully merged before the
+        # next one so that later sources still win.
+        stack: List[Tuple[AnyDict, Iterator[Tuple[Any, Any]]]] = [
+            (dest, iter(src.items()))
+        ]
+        while stack:
+            node, items = stack[-1]
+            for key, value in items:
+                kind = type(value)
+                if not (kind is dict or kind is cls_dict or isinstance(value, Mapping)):
+                    # overwrite with simple value
+                    node[key] = value
+                    continue
+
+                prev = node.get(key, NOT_FOUND)
+                if type(prev) is cls_dict:  # common case: already converted
+                    pass
+                elif prev is NOT_FOUND or not isinstance(prev, dict):
+                    prev = None  # nothing to extend
+                elif not isinstance(prev, cls_dict):  # extendable
                     prev = cls_dict(prev)
-                dest[key] = dict_merge(prev, value, cls_dict=cls_dict)
-            else:  # cannot extend
-                dest[key] = value
+                    node[key] = prev
+
+                target = cls_dict if prev is None else type(prev)
+                if _is_flat(value, target, cls_dict):
+                    if prev is None:  # copy in one step
+                        node[key] = cls_dict(value)
+                    else:  # bulk copy
+                        prev.update(value)
+                    continue
+
+                if prev is None:
+                    prev = cls_dict()
+                    node[key] = prev
+                stack.append((prev, iter(value.items())))
+                break  # descend into `prev`
+            else:  # `node` is done
+                stack.pop()
     return dest
@@ -16,6 +16,13 @@ STATUS_ERROR = "error"
 
 Msg = Optional[str]
 
+# Default response (copied into each new `JSend`, never mutated)
+_SUCCESS_DEFAULTS: Dict[str, Any] = {
+    "ok": True,
+    "status": STATUS_SUCCESS,
+    "data": None,
+}
+
 
 class JSend(AttrDict):
     """Service response object.
@@ -37,9 +44,14 @@ class JSend(AttrDict):
             True
             >>> result == {'ok': True, 'status': 'success', 'data': None}
             True
+
+            Arguments override the defaults:
+            >>> JSend({'ok': False}, data=5)
+            {'ok': False, 'status': 'success', 'data': 5}
         """
-        self.update(ok=True, status=STATUS_SUCCESS, data=None)
-        super().__init__(*args, **kwargs)
+        super().__init__(_SUCCESS_DEFAULTS)
+        if args or kwargs:  # NOTE: skip the second pass in the common case
+            self.update(*args, **kwargs)
 
     def fail(self, message: Msg = None) -> JSend:
         """Indicate a controlled failure.
@@ -98,3 +98,51 @@ def test_double_nested() -> None:
     want = dict(a=1, b=dict(c=3, d=dict(e=4, f=6)))
     have = one << two
     assert want == have, "expect 2-nested merge"
+
+
+def test_deeply_nested() -> None:
+    """Expect merging to not be limited by recursion depth."""
+    depth = sys.getrecursionlimit() * 2
+    one: Dict[str, Any] = {}
+    two: Dict[str, Any] = {}
+    node1, node2 = one, two
+    for _ in range(depth):
+        node1["a"], node2["a"] = {}, {}
+        node1, node2 = node1["a"], node2["a"]
+    node1["b"], node2["c"] = 1, 2
+
+    have: Any = AttrDict() << one << two
+    for _ in range(depth):
+        have = have.a
+    assert have == dict(b=1, c=2), "expect deep merge"
+
+
+def test_path_keys() -> None:
+    """Expect non-`str` keys to be set as paths whether or not `src` is flat."""
+    src: Dict[Any, Any] = {("a", "b"): 1}
+    want: Dict[str, Any] = dict(a=dict(b=1))
+    assert AttrDict() << src == want, "expect flat source as path"
+
+    src = {("a", "b"): 1, "z": {"q": 1}}
+    want = dict(a=dict(b=1), z=dict(q=1))
+    assert AttrDict() << src == want, "expect nested source as path"
+
+    src = {"x": {("a", "b"): 1}}
+    want = dict(x=dict(a=dict(b=1)))
+    assert AttrDict() << src == want, "expect nested path"
+
+
+def test_setattr_class_changes() -> None:
+    """Expect class attributes added or removed later to be respected."""
+
+    class Sub(AttrDict):
+        extra = 1
+
+    item = Sub()
+    item.extra = 5
+    assert dict(item) == {}, "expect instance attribute"
+
+    del Sub.extra
+    item = Sub()
+    item.extra = 3
+    assert dict(item) == {"extra": 3}, "expect key/value after class change"
@@ -0,0 +1,46 @@
+"""Test config loading."""
+
+# native
+from pathlib import Path
+import json
+
+# pkg
+from attrbox.config import load_config
+
+
+def test_diamond_imports(tmp_path: Path) -> None:
+    """Expect a shared import to load once, where it is first imported."""
+    files = {
+        "a.json": {"imports": ["b.json", "c.json"]},
+        "b.json": {"imports": ["d.json"], "k": "b"},
+        "c.json": {"imports": ["d.json"], "c": True},
+        "d.json": {"k": "d", "d": True},
+    }
+    for name, data in files.items():
+        (tmp_path / name).write_text(json.dumps(data))
+
+    have = load_config(tmp_path / "a.json")
+    want = {"k": "b", "c": True, "d": True}
+    assert have == want, "expect b to override d, loaded only under b"
+
+
+def test_done_list(tmp_path: Path) -> None:
+    """Expect `done` to accept any iterable of paths to skip."""
+    (tmp_path / "a.json").write_text(json.dumps({"imports": ["b.json"], "a": 1}))
+    (tmp_path / "b.json").write_text(json.dumps({"b": 2}))
+
+    skip = [(tmp_path / "b.json").resolve()]
+    assert load_config(tmp_path / "a.json", done=skip) == {"a": 1}
+
+
+def test_repeated_import(tmp_path: Path) -> None:
+    """Expect an import repeated in one list to load once, where it is first."""
+    files = {
+        "a.json": {"imports": ["b.json", "c.json", "b.json"]},
+        "b.json": {"k": "b"},
+        "c.json": {"k": "c"},
+    }
+    for name, data in files.items():
+        (tmp_path / name).write_text(json.dumps(data))
+
+    assert load_config(tmp_path / "a.json") == {"k": "c"}, "expect b loaded once"
@@ -0,0 +1,47 @@
+"""Test generic get."""
+
+# native
+from collections import Counter
+from collections import defaultdict
+from typing import Any
+from typing import Dict
+
+# pkg
+from attrbox import AttrDict
+from attrbox.fn import compile_path
+from attrbox.fn import get_path
+
+
+def test_missing_defaultdict() -> None:
+    src: Dict[str, Any] = {"a": defaultdict(int)}
+    assert get_path(src, ["a", "x"]) == 0
+    assert get_path(src, ("a", "y")) == 0
+    assert compile_path(("a", "z"))(src) == 0
+
+
+def test_missing_counter() -> None:
+    src: Dict[str, Any] = {"a": {"b": Counter(c=2)}}
+    assert get_path(src, ["a", "b", "c"]) == 2
+    assert get_path(src, ("a", "b", "x")) == 0
+
+
+def test_missing_attrdict() -> None:
+    src = AttrDict(a={"b": 1})
+    assert get_path(src, ["a", "x"], 5) == 5
+    assert get_path(src, ("a", "x"), 5) == 5
+    assert compile_path(("a", "x"))(src, 5) == 5
+
+
+def test_missing_single_key() -> None:
+    assert get_path(defaultdict(int), "x") == 0
+    assert get_path(Counter(), 1) == 0
+    assert get_path({"a": 1}, "x", 5) == 5
+    assert get_path({"a": 1}, ("x",), 5) == 5
+
+
+def test_not_containers() -> None:
+    src: Dict[str, Any] = {"a": "hello", "b": (1, 2), "c": b"x", "d": [0, [1]]}
+    assert get_path(src, ["a", 0]) is None
+    assert get_path(src, ("b", 0), 5) == 5
+    assert get_path(src, ["c", 0]) is None
+    assert get_path(src, ["d", 1, 0]) == 1
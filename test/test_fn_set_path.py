@@ -1,5 +1,9 @@
 """Test generic set."""
 
+# native
+from typing import Any
+from typing import Dict
+
 # pkg
 from attrbox.fn import set_path
 
@@ -74,3 +78,18 @@ def test_bad_paths_list() -> None:
     have = set_path([1], "a", "works")
     want = [1, {"a": "works"}]
     assert have == want
+
+
+def test_new_nested_path() -> None:
+    have = set_path({"a": 1}, ["b", 1, "c", 0], 2)
+    want = {"a": 1, "b": [None, {"c": [2]}]}
+    assert have == want
+
+
+def test_in_place() -> None:
+    item: Dict[str, Any] = {"a": {"b": [1]}}
+    inner = item["a"]
+    have = set_path(item, ["a", "b", 0], 2)
+    assert have is item
+    assert item["a"] is inner
+    assert inner == {"b": [2]}